@@ -8,6 +8,7 @@ let homeDir = FileManager.default.homeDirectoryForCurrentUser.path
 let projectDir = "\(homeDir)/taskwarrior-reminders-sync"
 let pythonPath = "\(projectDir)/.venv/bin/python"
 let syncModule = "tw_reminders.sync_from_reminders"
+let socketPath = "\(homeDir)/.local/share/tw-reminders/listener.sock"
 
 // MARK: - Reminder JSON Model
 
@@ -111,12 +112,7 @@ func reminderToJSON(_ reminder: EKReminder) -> ReminderJSON {
 
 // MARK: - Commands
 
-func exportReminders(pendingOnly: Bool = false, locationOnly: Bool = false) {
-    guard requestAccess() else {
-        fputs("Error: Reminders access denied\n", stderr)
-        exit(1)
-    }
-
+func fetchReminderJSON(pendingOnly: Bool = false, locationOnly: Bool = false) -> [ReminderJSON] {
     var reminders = fetchAllReminders()
 
     if pendingOnly {
@@ -127,7 +123,16 @@ func exportReminders(pendingOnly: Bool = false, locationOnly: Bool = false) {
         reminders = reminders.filter { getLocationAlarm($0) != nil }
     }
 
-    let jsonReminders = reminders.map { reminderToJSON($0) }
+    return reminders.map { reminderToJSON($0) }
+}
+
+func exportReminders(pendingOnly: Bool = false, locationOnly: Bool = false) {
+    guard requestAccess() else {
+        fputs("Error: Reminders access denied\n", stderr)
+        exit(1)
+    }
+
+    let jsonReminders = fetchReminderJSON(pendingOnly: pendingOnly, locationOnly: locationOnly)
 
     let encoder = JSONEncoder()
     encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
@@ -189,6 +194,8 @@ func startListener() {
         exit(1)
     }
 
+    startSocketServer()
+
     fputs("Listening for Reminders changes...\n", stderr)
 
     // Listen for changes (event-driven, no polling)
@@ -222,18 +229,16 @@ func triggerSync() {
 
 // MARK: - Create/Update/Delete
 
-func createReminder(json: String) {
-    guard requestAccess() else {
-        fputs("{\"error\": \"Reminders access denied\"}\n", stderr)
-        exit(1)
-    }
+struct CommandError: Error {
+    let message: String
+}
 
-    guard let data = json.data(using: .utf8),
-          let dict = try? JSONSerialization.jsonObject(with: data) as? [String: Any] else {
-        fputs("{\"error\": \"Invalid JSON\"}\n", stderr)
-        exit(1)
-    }
+func parseJSONObject(_ json: String) -> [String: Any]? {
+    guard let data = json.data(using: .utf8) else { return nil }
+    return try? JSONSerialization.jsonObject(with: data) as? [String: Any]
+}
 
+func performCreate(_ dict: [String: Any]) throws -> [String: Any] {
     let reminder = EKReminder(eventStore: store)
     reminder.title = dict["title"] as? String ?? "Untitled"
 
@@ -287,38 +292,20 @@ func createReminder(json: String) {
         reminder.addAlarm(alarm)
     }
 
-    do {
-        try store.save(reminder, commit: true)
-        let result: [String: Any] = [
-            "status": "created",
-            "identifier": reminder.calendarItemIdentifier
-        ]
-        if let jsonData = try? JSONSerialization.data(withJSONObject: result),
-           let jsonStr = String(data: jsonData, encoding: .utf8) {
-            print(jsonStr)
-        }
-    } catch {
-        fputs("{\"error\": \"\(error.localizedDescription)\"}\n", stderr)
-        exit(1)
-    }
+    try store.save(reminder, commit: true)
+    return [
+        "status": "created",
+        "identifier": reminder.calendarItemIdentifier
+    ]
 }
 
-func updateReminder(json: String) {
-    guard requestAccess() else {
-        fputs("{\"error\": \"Reminders access denied\"}\n", stderr)
-        exit(1)
-    }
-
-    guard let data = json.data(using: .utf8),
-          let dict = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
-          let identifier = dict["identifier"] as? String else {
-        fputs("{\"error\": \"Invalid JSON or missing identifier\"}\n", stderr)
-        exit(1)
+func performUpdate(_ dict: [String: Any]) throws -> [String: Any] {
+    guard let identifier = dict["identifier"] as? String else {
+        throw CommandError(message: "Invalid JSON or missing identifier")
     }
 
     guard let reminder = store.calendarItem(withIdentifier: identifier) as? EKReminder else {
-        fputs("{\"error\": \"Reminder not found\"}\n", stderr)
-        exit(1)
+        throw CommandError(message: "Reminder not found")
     }
 
     // Update fields if provided
@@ -350,35 +337,195 @@ func updateReminder(json: String) {
         }
     }
 
-    do {
-        try store.save(reminder, commit: true)
-        print("{\"status\": \"updated\"}")
-    } catch {
-        fputs("{\"error\": \"\(error.localizedDescription)\"}\n", stderr)
-        exit(1)
+    try store.save(reminder, commit: true)
+    return ["status": "updated"]
+}
+
+func performDelete(identifier: String) throws -> [String: Any] {
+    guard let reminder = store.calendarItem(withIdentifier: identifier) as? EKReminder else {
+        throw CommandError(message: "Reminder not found")
     }
+
+    try store.remove(reminder, commit: true)
+    return ["status": "deleted"]
 }
 
-func deleteReminder(identifier: String) {
+/// Dispatch a single {"op": ...} request to its handler.
+func performOp(_ dict: [String: Any]) throws -> [String: Any] {
+    guard let op = dict["op"] as? String else {
+        throw CommandError(message: "Missing op")
+    }
+
+    switch op {
+    case "create":
+        return try performCreate(dict)
+    case "update":
+        return try performUpdate(dict)
+    case "delete":
+        guard let identifier = dict["identifier"] as? String else {
+            throw CommandError(message: "Missing identifier")
+        }
+        return try performDelete(identifier: identifier)
+    default:
+        throw CommandError(message: "Unknown op: \(op)")
+    }
+}
+
+func errorMessage(_ error: Error) -> String {
+    return (error as? CommandError)?.message ?? error.localizedDescription
+}
+
+/// Run a CLI command: print the JSON result, or the error to stderr and exit(1).
+func runCommand(_ body: () throws -> [String: Any]) {
     guard requestAccess() else {
         fputs("{\"error\": \"Reminders access denied\"}\n", stderr)
         exit(1)
     }
 
-    guard let reminder = store.calendarItem(withIdentifier: identifier) as? EKReminder else {
-        fputs("{\"error\": \"Reminder not found\"}\n", stderr)
+    do {
+        let result = try body()
+        if let jsonData = try? JSONSerialization.data(withJSONObject: result),
+           let jsonStr = String(data: jsonData, encoding: .utf8) {
+            print(jsonStr)
+        }
+    } catch {
+        fputs("{\"error\": \"\(errorMessage(error))\"}\n", stderr)
         exit(1)
     }
+}
 
+func createReminder(json: String) {
+    runCommand {
+        guard let dict = parseJSONObject(json) else {
+            throw CommandError(message: "Invalid JSON")
+        }
+        return try performCreate(dict)
+    }
+}
+
+func updateReminder(json: String) {
+    runCommand {
+        guard let dict = parseJSONObject(json) else {
+            throw CommandError(message: "Invalid JSON or missing identifier")
+        }
+        return try performUpdate(dict)
+    }
+}
+
+func deleteReminder(identifier: String) {
+    runCommand { try performDelete(identifier: identifier) }
+}
+
+// MARK: - Socket Server
+
+/// Handle one newline-delimited JSON request from a hook or sync process.
+/// Requests look like {"op": "create", ...}; the response is a single JSON
+/// line, with {"error": "..."} on failure.
+func handleRequest(_ data: Data) -> Data {
     do {
-        try store.remove(reminder, commit: true)
-        print("{\"status\": \"deleted\"}")
+        guard let dict = try? JSONSerialization.jsonObject(with: data) as? [String: Any] else {
+            throw CommandError(message: "Invalid JSON")
+        }
+
+        if dict["op"] as? String == "export" {
+            let reminders = fetchReminderJSON(
+                pendingOnly: dict["pending_only"] as? Bool ?? false,
+                locationOnly: dict["with_location"] as? Bool ?? false
+            )
+            return try JSONEncoder().encode(reminders)
+        }
+        return try JSONSerialization.data(withJSONObject: try performOp(dict))
     } catch {
-        fputs("{\"error\": \"\(error.localizedDescription)\"}\n", stderr)
-        exit(1)
+        let response = ["error": errorMessage(error)]
+        return (try? JSONSerialization.data(withJSONObject: response)) ?? Data()
+    }
+}
+
+func handleClient(_ fd: Int32) {
+    // Don't let a stalled client block the server forever
+    var timeout = timeval(tv_sec: 10, tv_usec: 0)
+    setsockopt(fd, SOL_SOCKET, SO_RCVTIMEO, &timeout, socklen_t(MemoryLayout<timeval>.size))
+
+    var request = Data()
+    var buffer = [UInt8](repeating: 0, count: 4096)
+    while !request.contains(UInt8(ascii: "\n")) {
+        let n = read(fd, &buffer, buffer.count)
+        if n <= 0 { break }
+        request.append(contentsOf: buffer[0..<n])
+    }
+
+    var response = handleRequest(request)
+    response.append(UInt8(ascii: "\n"))
+    response.withUnsafeBytes { raw in
+        var offset = 0
+        while offset < raw.count {
+            let n = write(fd, raw.baseAddress! + offset, raw.count - offset)
+            if n <= 0 { break }
+            offset += n
+        }
     }
 }
 
+/// Serve create/update/delete/export requests on a Unix socket so hooks
+/// don't pay process startup and EventKit setup on every call.
+func startSocketServer() {
+    // Clients may disconnect before reading the response
+    signal(SIGPIPE, SIG_IGN)
+    unlink(socketPath)
+
+    let fd = socket(AF_UNIX, SOCK_STREAM, 0)
+    guard fd >= 0 else {
+        fputs("Error creating socket: \(String(cString: strerror(errno)))\n", stderr)
+        return
+    }
+
+    var addr = sockaddr_un()
+    addr.sun_family = sa_family_t(AF_UNIX)
+    let pathBytes = Array(socketPath.utf8CString)
+    guard pathBytes.count <= MemoryLayout.size(ofValue: addr.sun_path) else {
+        fputs("Error: socket path too long: \(socketPath)\n", stderr)
+        close(fd)
+        return
+    }
+    withUnsafeMutableBytes(of: &addr.sun_path) { dst in
+        pathBytes.withUnsafeBytes { dst.copyMemory(from: $0) }
+    }
+
+    let bound = withUnsafePointer(to: &addr) {
+        $0.withMemoryRebound(to: sockaddr.self, capacity: 1) {
+            bind(fd, $0, socklen_t(MemoryLayout<sockaddr_un>.size))
+        }
+    }
+    guard bound == 0, listen(fd, 16) == 0 else {
+        fputs("Error binding socket: \(String(cString: strerror(errno)))\n", stderr)
+        close(fd)
+        return
+    }
+    chmod(socketPath, 0o600)
+
+    // Accept off the main run loop; each client gets its own thread so a
+    // slow export doesn't hold up hook requests queued behind it
+    Thread.detachNewThread {
+        while true {
+            let client = accept(fd, nil, nil)
+            if client < 0 {
+                if errno != EINTR {
+                    fputs("Error accepting connection: \(String(cString: strerror(errno)))\n", stderr)
+                    // Back off rather than spin on a persistent error
+                    sleep(1)
+                }
+                continue
+            }
+            Thread.detachNewThread {
+                handleClient(client)
+                close(client)
+            }
+        }
+    }
+
+    fputs("Serving requests on \(socketPath)\n", stderr)
+}
+
 func parseDate(_ str: String) -> Date? {
     let formatters = [
         ISO8601DateFormatter(),
@@ -394,19 +541,36 @@ func parseDate(_ str: String) -> Date? {
     return df.date(from: str)
 }
 
+/// JSON payload from the first positional argument, or from stdin if none was given.
+func readJSONArgument(_ positionalArgs: [String]) -> String? {
+    if let json = positionalArgs.first {
+        return json
+    }
+    // Don't block waiting for input on an interactive terminal
+    if isatty(STDIN_FILENO) != 0 {
+        return nil
+    }
+    let data = FileHandle.standardInput.readDataToEndOfFile()
+    return data.isEmpty ? nil : String(data: data, encoding: .utf8)
+}
+
 func printUsage() {
     let usage = """
     Usage: tw-reminders-listener <command> [options]
 
     Commands:
-      listen              Start listening for Reminders changes (daemon mode)
+      listen              Start listening for Reminders changes (daemon mode);
+                          also serves hook requests on listener.sock
       export              Export reminders as JSON to stdout
       export-locations    Export unique locations from location-based reminders
-      create <json>       Create a reminder from JSON
-      update <json>       Update a reminder (requires identifier in JSON)
+      create [json]       Create a reminder from JSON
+      update [json]       Update a reminder (requires identifier in JSON)
       delete <identifier> Delete a reminder by identifier
       help                Show this help message
 
+    create and update read the JSON from stdin when it isn't given
+    as an argument.
+
     Export options:
       --pending-only      Only export incomplete reminders
       --with-location     Only export reminders with location
@@ -418,6 +582,7 @@ func printUsage() {
     Examples:
       tw-reminders-listener export --pending-only
       tw-reminders-listener create '{"title": "Buy milk", "list": "Groceries"}'
+      echo '{"title": "Buy milk"}' | tw-reminders-listener create
       tw-reminders-listener delete "ABC123-DEF456"
     """
     print(usage)
@@ -444,14 +609,14 @@ case "export":
 case "export-locations":
     exportLocations()
 case "create":
-    guard let json = positionalArgs.first else {
-        fputs("Error: create requires JSON argument\n", stderr)
+    guard let json = readJSONArgument(positionalArgs) else {
+        fputs("Error: create requires JSON argument or stdin\n", stderr)
         exit(1)
     }
     createReminder(json: json)
 case "update":
-    guard let json = positionalArgs.first else {
-        fputs("Error: update requires JSON argument\n", stderr)
+    guard let json = readJSONArgument(positionalArgs) else {
+        fputs("Error: update requires JSON argument or stdin\n", stderr)
         exit(1)
     }
     updateReminder(json: json)
@@ -1,6 +1,12 @@
 """Configuration for Taskwarrior-Reminders sync."""
+import os
 from pathlib import Path
-import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    import json
+    orjson = None
 
 HOME = Path.home()
 # Derive project dir from this file's location (handles any install path)
@@ -14,18 +20,39 @@ CONFIG = {
     "taskwarrior_data": str(HOME / ".task"),
     "sync_state_file": str(DATA_DIR / "sync_state.json"),
     "locations_file": str(DATA_DIR / "locations.json"),
+    "listener_socket": str(DATA_DIR / "listener.sock"),
     "swift_binary": str(PROJECT_DIR / ".build/release/tw-reminders-listener"),
     "default_list": "Reminders",
 }
 
 
-def load_json(path: Path) -> dict:
-    """Load JSON file, return empty dict if not found."""
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
+def json_loads(data: bytes | memoryview | str):
+    """Parse JSON from bytes, a memoryview or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file and rename it over path.
 
+    A process killed mid-write leaves the old file intact instead of a
+    truncated one.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
-def save_json(path: Path, data: dict) -> None:
-    """Save dict as JSON file."""
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
@@ -5,7 +5,10 @@ Taskwarrior on-add hook for Reminders sync.
 Reads new task JSON from stdin, creates Reminder via Swift,
 adds reminder_id to task, outputs modified task JSON.
 """
-import json
+import bisect
+import functools
+import mmap
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -13,41 +16,78 @@ from pathlib import Path
 # Configuration - derive paths from script location (handles symlinks)
 SCRIPT_PATH = Path(__file__).resolve()  # Resolve symlink to actual location
 REPO_ROOT = SCRIPT_PATH.parent.parent.parent.parent  # src/tw_reminders/hooks -> repo root
-SWIFT_BINARY = REPO_ROOT / ".build/release/tw-reminders-listener"
+
+# Hooks run as standalone scripts; import shared helpers from the package source
+sys.path.insert(0, str(REPO_ROOT / "src"))
+from tw_reminders.config import json_dumps, json_loads, write_atomic
+from tw_reminders.listener import ListenerTimeout, listener_request
+
+# Kept as str since it is only ever used as a subprocess argument
+SWIFT_BINARY = os.fspath(REPO_ROOT / ".build/release/tw-reminders-listener")
 SYNC_STATE_FILE = Path.home() / ".local/share/tw-reminders/sync_state.json"
 LOCATIONS_FILE = Path.home() / ".local/share/tw-reminders/locations.json"
 
-
-def load_locations() -> dict:
-    """Load named locations from config."""
-    if LOCATIONS_FILE.exists():
-        data = json.loads(LOCATIONS_FILE.read_text())
-        return data.get("locations", {})
-    return {}
+# Taskwarrior priority -> Reminder priority (0 = none)
+PRIORITY_TO_REMINDER = {"H": 1, "M": 5, "L": 9}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_location_index(mtime: float) -> tuple[list, list]:
+    """Parse locations file into a lookup index.
+
+    Returns (keys, entries): keys is a sorted list of (lowercased key,
+    position) for prefix search, entries is (lowercased name, data) in
+    file order. Keyed on mtime so edits to the file invalidate the cache.
+    """
+    # Parse straight from the page cache rather than copying into a bytes object
+    with open(LOCATIONS_FILE, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+        locations = json_loads(view).get("locations", {})
+    entries = []
+    keys = []
+    for pos, (key, data) in enumerate(locations.items()):
+        entries.append(((data.get("name") or "").lower(), data))
+        keys.append((key.lower(), pos))
+    keys.sort()
+    return keys, entries
+
+
+def load_location_index() -> tuple[list, list]:
+    """Load named locations from config as a lookup index."""
+    try:
+        mtime = LOCATIONS_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return [], []
+    return _load_location_index(mtime)
 
 
 def lookup_location(loc_key: str) -> dict | None:
     """Look up location by shorthand key."""
-    locations = load_locations()
-    # Try exact match first
-    if loc_key.lower() in locations:
-        return locations[loc_key.lower()]
-    # Try partial match
-    for key, data in locations.items():
-        if key.startswith(loc_key.lower()) or loc_key.lower() in data.get("name", "").lower():
+    keys, entries = load_location_index()
+    key = loc_key.lower()
+
+    # Keys sharing a prefix are contiguous once sorted; an exact match sorts first
+    start = bisect.bisect_left(keys, (key, -1))
+    end = start
+    while end < len(keys) and keys[end][0].startswith(key):
+        end += 1
+    if start < end:
+        if keys[start][0] == key:
+            return entries[keys[start][1]][1]
+        # Partial key match - prefer the earliest in the file
+        return entries[min(pos for _, pos in keys[start:end])][1]
+
+    # Fall back to substring match on the location name
+    for lower_name, data in entries:
+        if key in lower_name:
             return data
     return None
 
 
 def map_priority_to_reminder(priority: str | None) -> int:
     """Map Taskwarrior priority (H/M/L) to Reminder (1/5/9)."""
-    if priority == "H":
-        return 1
-    elif priority == "M":
-        return 5
-    elif priority == "L":
-        return 9
-    return 0  # No priority
+    return PRIORITY_TO_REMINDER.get(priority, 0)
 
 
 def create_reminder(task: dict) -> str | None:
@@ -94,17 +134,29 @@ def create_reminder(task: dict) -> str | None:
         reminder_data["location_trigger"] = task["location_trigger"]
 
     try:
-        result = subprocess.run(
-            [str(SWIFT_BINARY), "create", json.dumps(reminder_data)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            response = json.loads(result.stdout)
-            return response.get("identifier")
-        else:
-            print(f"Swift error: {result.stderr}", file=sys.stderr)
+        response = listener_request({"op": "create", **reminder_data})
+        if response is None:
+            # Listener not running - fall back to a one-off Swift process
+            result = subprocess.run(
+                [SWIFT_BINARY, "create"],
+                input=json_dumps(reminder_data),
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                print(f"Swift error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+                return None
+            response = json_loads(result.stdout)
+        if "error" in response:
+            print(f"Swift error: {response['error']}", file=sys.stderr)
+            return None
+        return response.get("identifier")
+    except ListenerTimeout as e:
+        # Outcome unknown: the reminder may still be created, just without
+        # its reminder_id recorded here
+        print(f"Hook warning: {e}; reminder may exist without a link to this task", file=sys.stderr)
+    except FileNotFoundError:
+        print(f"Swift binary not found at {SWIFT_BINARY}; run install.sh to build it", file=sys.stderr)
     except Exception as e:
         print(f"Hook error: {e}", file=sys.stderr)
 
@@ -115,8 +167,12 @@ def update_sync_state(uuid: str, reminder_id: str, modified: str):
     """Update sync state file with new mapping."""
     SYNC_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    if SYNC_STATE_FILE.exists():
-        state = json.loads(SYNC_STATE_FILE.read_text())
+    try:
+        raw = SYNC_STATE_FILE.read_bytes()
+    except FileNotFoundError:
+        raw = b""
+    if raw:
+        state = json_loads(raw)
     else:
         state = {"version": 1, "mappings": {}, "last_sync": None}
 
@@ -127,16 +183,16 @@ def update_sync_state(uuid: str, reminder_id: str, modified: str):
         "reminder_modified": "",
     }
 
-    SYNC_STATE_FILE.write_text(json.dumps(state, indent=2))
+    write_atomic(SYNC_STATE_FILE, json_dumps(state, indent=True))
 
 
 def main():
     # Read new task from stdin
-    task = json.loads(sys.stdin.readline())
+    task = json_loads(sys.stdin.buffer.readline())
 
     # Skip if task already has reminder_id (synced from Reminders)
     if task.get("reminder_id"):
-        print(json.dumps(task))
+        sys.stdout.buffer.write(json_dumps(task) + b"\n")
         return 0
 
     # Create reminder
@@ -154,7 +210,7 @@ def main():
         )
 
     # Output modified task (required by Taskwarrior)
-    print(json.dumps(task))
+    sys.stdout.buffer.write(json_dumps(task) + b"\n")
     return 0
 
 
@@ -5,7 +5,7 @@ Taskwarrior on-modify hook for Reminders sync.
 Reads original and modified task JSON from stdin,
 updates corresponding Reminder via Swift if needed.
 """
-import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -13,26 +13,34 @@ from pathlib import Path
 # Configuration - derive paths from script location (handles symlinks)
 SCRIPT_PATH = Path(__file__).resolve()  # Resolve symlink to actual location
 REPO_ROOT = SCRIPT_PATH.parent.parent.parent.parent  # src/tw_reminders/hooks -> repo root
-SWIFT_BINARY = REPO_ROOT / ".build/release/tw-reminders-listener"
+
+# Hooks run as standalone scripts; import shared helpers from the package source
+sys.path.insert(0, str(REPO_ROOT / "src"))
+from tw_reminders.config import json_dumps, json_loads, write_atomic
+from tw_reminders.listener import ListenerTimeout, listener_request
+
+# Kept as str since it is only ever used as a subprocess argument
+SWIFT_BINARY = os.fspath(REPO_ROOT / ".build/release/tw-reminders-listener")
 SYNC_STATE_FILE = Path.home() / ".local/share/tw-reminders/sync_state.json"
 
+# Taskwarrior priority -> Reminder priority (0 = none)
+PRIORITY_TO_REMINDER = {"H": 1, "M": 5, "L": 9}
+
 
 def map_priority_to_reminder(priority: str | None) -> int:
     """Map Taskwarrior priority (H/M/L) to Reminder (1/5/9)."""
-    if priority == "H":
-        return 1
-    elif priority == "M":
-        return 5
-    elif priority == "L":
-        return 9
-    return 0
+    return PRIORITY_TO_REMINDER.get(priority, 0)
 
 
 def get_reminder_id(uuid: str) -> str | None:
     """Get reminder_id from sync state."""
-    if not SYNC_STATE_FILE.exists():
+    try:
+        raw = SYNC_STATE_FILE.read_bytes()
+    except FileNotFoundError:
+        return None
+    if not raw:
         return None
-    state = json.loads(SYNC_STATE_FILE.read_text())
+    state = json_loads(raw)
     mapping = state.get("mappings", {}).get(uuid)
     return mapping.get("reminder_id") if mapping else None
 
@@ -62,16 +70,29 @@ def update_reminder(reminder_id: str, task: dict, original: dict) -> bool:
         return True  # No changes to sync
 
     try:
-        result = subprocess.run(
-            [str(SWIFT_BINARY), "update", json.dumps(update_data)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            print(f"Swift error: {result.stderr}", file=sys.stderr)
+        response = listener_request({"op": "update", **update_data})
+        if response is None:
+            # Listener not running - fall back to a one-off Swift process
+            result = subprocess.run(
+                [SWIFT_BINARY, "update"],
+                input=json_dumps(update_data),
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                print(f"Swift error: {result.stderr.decode(errors='replace')}", file=sys.stderr)
+                return False
+        elif "error" in response:
+            print(f"Swift error: {response['error']}", file=sys.stderr)
             return False
         return True
+    except ListenerTimeout as e:
+        # Outcome unknown; don't retry through the binary
+        print(f"Hook warning: {e}; change may or may not have been applied", file=sys.stderr)
+        return False
+    except FileNotFoundError:
+        print(f"Swift binary not found at {SWIFT_BINARY}; run install.sh to build it", file=sys.stderr)
+        return False
     except Exception as e:
         print(f"Hook error: {e}", file=sys.stderr)
         return False
@@ -80,13 +101,22 @@ def update_reminder(reminder_id: str, task: dict, original: dict) -> bool:
 def delete_reminder(reminder_id: str) -> bool:
     """Delete reminder via Swift binary."""
     try:
+        response = listener_request({"op": "delete", "identifier": reminder_id})
+        if response is not None:
+            return "error" not in response
         result = subprocess.run(
-            [str(SWIFT_BINARY), "delete", reminder_id],
+            [SWIFT_BINARY, "delete", reminder_id],
             capture_output=True,
-            text=True,
             timeout=10,
         )
         return result.returncode == 0
+    except ListenerTimeout as e:
+        # Outcome unknown; don't retry through the binary
+        print(f"Hook warning: {e}; change may or may not have been applied", file=sys.stderr)
+        return False
+    except FileNotFoundError:
+        print(f"Swift binary not found at {SWIFT_BINARY}; run install.sh to build it", file=sys.stderr)
+        return False
     except Exception as e:
         print(f"Hook error: {e}", file=sys.stderr)
         return False
@@ -94,18 +124,23 @@ def delete_reminder(reminder_id: str) -> bool:
 
 def remove_from_sync_state(uuid: str):
     """Remove mapping from sync state."""
-    if not SYNC_STATE_FILE.exists():
+    try:
+        raw = SYNC_STATE_FILE.read_bytes()
+    except FileNotFoundError:
+        return
+    if not raw:
         return
-    state = json.loads(SYNC_STATE_FILE.read_text())
+    state = json_loads(raw)
     if uuid in state.get("mappings", {}):
         del state["mappings"][uuid]
-        SYNC_STATE_FILE.write_text(json.dumps(state, indent=2))
+        write_atomic(SYNC_STATE_FILE, json_dumps(state, indent=True))
 
 
 def main():
-    # Read original and modified task from stdin
-    original = json.loads(sys.stdin.readline())
-    modified = json.loads(sys.stdin.readline())
+    # Read original and modified task from stdin (one JSON object per line)
+    original_line, modified_line = sys.stdin.buffer.read().split(b"\n", 1)
+    original = json_loads(original_line)
+    modified = json_loads(modified_line)
 
     # Get reminder_id (from task or sync state)
     reminder_id = modified.get("reminder_id") or get_reminder_id(modified["uuid"])
@@ -120,7 +155,7 @@ def main():
             update_reminder(reminder_id, modified, original)
 
     # Output modified task (required by Taskwarrior)
-    print(json.dumps(modified))
+    sys.stdout.buffer.write(json_dumps(modified) + b"\n")
     return 0
 
 
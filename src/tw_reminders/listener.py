@@ -0,0 +1,40 @@
+"""Client for the Swift listener's Unix socket."""
+import socket
+
+from .config import CONFIG, json_dumps, json_loads
+
+
+class ListenerTimeout(Exception):
+    """The listener took the request but didn't answer in time.
+
+    The request may still be carried out, so callers must not retry it
+    through the Swift binary.
+    """
+
+
+def listener_request(request: dict, timeout: float | None = 10):
+    """Send a request to the running listener over its Unix socket.
+
+    Returns the decoded response, or None if the listener isn't reachable
+    so the caller can fall back to running the Swift binary. Raises
+    ListenerTimeout if the request was sent but no response arrived.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(CONFIG["listener_socket"])
+        except OSError:
+            return None
+        chunks = []
+        try:
+            sock.sendall(json_dumps(request) + b"\n")
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        except TimeoutError as e:
+            raise ListenerTimeout(f"no response from listener within {timeout}s") from e
+    return json_loads(b"".join(chunks))
@@ -4,7 +4,6 @@ Sync from Apple Reminders to Taskwarrior.
 
 Called by Swift listener when EKEventStoreChanged fires.
 """
-import json
 import subprocess
 import sys
 from datetime import datetime
@@ -16,35 +15,46 @@ from tasklib import TaskWarrior, Task
 if __name__ == "__main__":
     # Add parent to path for standalone execution
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from tw_reminders.config import CONFIG
+    from tw_reminders.config import CONFIG, json_loads
+    from tw_reminders.listener import ListenerTimeout, listener_request
     from tw_reminders.sync_state import SyncState, SyncMapping
 else:
-    from .config import CONFIG
+    from .config import CONFIG, json_loads
+    from .listener import ListenerTimeout, listener_request
     from .sync_state import SyncState, SyncMapping
 
+# Reminder priority -> Taskwarrior priority
+PRIORITY_FROM_REMINDER = {1: "H", 5: "M", 9: "L"}
+
 
 def fetch_reminders(pending_only: bool = True) -> list[dict]:
-    """Fetch reminders via Swift binary."""
+    """Fetch reminders via the listener, or the Swift binary if it isn't running."""
+    try:
+        response = listener_request({"op": "export", "pending_only": pending_only}, timeout=60)
+    except ListenerTimeout as e:
+        # Export is read-only, so retrying through the binary is safe
+        print(f"Listener export timed out ({e}), falling back to Swift binary", file=sys.stderr)
+        response = None
+    if isinstance(response, dict):
+        print(f"Error fetching reminders: {response.get('error')}", file=sys.stderr)
+        return []
+    if response is not None:
+        return response
+
     cmd = [CONFIG["swift_binary"], "export"]
     if pending_only:
         cmd.append("--pending-only")
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
-        print(f"Error fetching reminders: {result.stderr}", file=sys.stderr)
+        print(f"Error fetching reminders: {result.stderr.decode(errors='replace')}", file=sys.stderr)
         return []
-    return json.loads(result.stdout)
+    return json_loads(result.stdout)
 
 
 def map_priority_from_reminder(priority: int) -> str | None:
     """Map Reminder priority (1/5/9) to Taskwarrior (H/M/L)."""
-    if priority == 1:
-        return "H"
-    elif priority == 5:
-        return "M"
-    elif priority == 9:
-        return "L"
-    return None
+    return PRIORITY_FROM_REMINDER.get(priority)
 
 
 def parse_date(iso_string: str | None) -> datetime | None:
@@ -52,16 +62,19 @@ def parse_date(iso_string: str | None) -> datetime | None:
     if not iso_string:
         return None
     try:
-        # Handle both formats: with and without fractional seconds
-        if "." in iso_string:
-            return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-        return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
+        # Python 3.11+ accepts "Z" and fractional seconds directly
+        return datetime.fromisoformat(iso_string)
     except ValueError:
         return None
 
 
+def fetch_tasks(tw: TaskWarrior) -> dict[str, Task]:
+    """Fetch all tasks (any status, like tasks.get(uuid=...)) once, keyed by UUID."""
+    return {str(t["uuid"]): t for t in tw.tasks.all()}
+
+
 def sync_reminder_to_task(
-    reminder: dict, tw: TaskWarrior, state: SyncState
+    reminder: dict, tw: TaskWarrior, state: SyncState, tasks_by_uuid: dict[str, Task]
 ) -> None:
     """Sync a single reminder to Taskwarrior."""
     reminder_id = reminder["identifier"]
@@ -69,7 +82,7 @@ def sync_reminder_to_task(
 
     if mapping:
         # Existing mapping - check if we need to update
-        task = tw.tasks.get(uuid=mapping.uuid)
+        task = tasks_by_uuid.get(mapping.uuid)
         if not task:
             # Task was deleted in TW, remove mapping
             state.remove_mapping(mapping.uuid)
@@ -124,6 +137,7 @@ def sync_reminder_to_task(
                 task["location_lon"] = reminder["locationLongitude"]
 
         task.save()
+        tasks_by_uuid[str(task["uuid"])] = task
 
         # Create mapping
         state.set_mapping(SyncMapping(
@@ -165,22 +179,22 @@ def update_task_from_reminder(task: Task, reminder: dict) -> None:
 
 
 def check_deleted_reminders(
-    reminders: list[dict], tw: TaskWarrior, state: SyncState
+    reminders: list[dict], state: SyncState, tasks_by_uuid: dict[str, Task]
 ) -> None:
     """Check for reminders that were deleted and mark tasks accordingly."""
     current_reminder_ids = {r["identifier"] for r in reminders}
+    deleted_ids = state.known_reminder_ids() - current_reminder_ids
 
-    for mapping in state.all_mappings():
-        if mapping.reminder_id not in current_reminder_ids:
-            # Reminder was deleted
-            try:
-                task = tw.tasks.get(uuid=mapping.uuid)
-                if task and task["status"] != "deleted":
-                    print(f"Reminder deleted, deleting task: {task['description']}")
-                    task.delete()
-            except Exception:
-                pass
-            state.remove_mapping(mapping.uuid)
+    for reminder_id in deleted_ids:
+        mapping = state.get_by_reminder_id(reminder_id)
+        try:
+            task = tasks_by_uuid.get(mapping.uuid)
+            if task and task["status"] != "deleted":
+                print(f"Reminder deleted, deleting task: {task['description']}")
+                task.delete()
+        except Exception:
+            pass
+        state.remove_mapping(mapping.uuid)
 
 
 def main():
@@ -206,14 +220,18 @@ def main():
         reminders = fetch_reminders()
         print(f"Fetched {len(reminders)} reminders")
 
-        for reminder in reminders:
-            try:
-                sync_reminder_to_task(reminder, tw, state)
-            except Exception as e:
-                print(f"Error syncing reminder {reminder.get('title')}: {e}", file=sys.stderr)
+        tasks_by_uuid = fetch_tasks(tw)
+
+        # Write sync state once at the end instead of after every mapping
+        with state.batch():
+            for reminder in reminders:
+                try:
+                    sync_reminder_to_task(reminder, tw, state, tasks_by_uuid)
+                except Exception as e:
+                    print(f"Error syncing reminder {reminder.get('title')}: {e}", file=sys.stderr)
 
-        check_deleted_reminders(reminders, tw, state)
-        state.update_last_sync()
+            check_deleted_reminders(reminders, state, tasks_by_uuid)
+            state.update_last_sync()
 
         print(f"[{datetime.now()}] Sync complete")
 
@@ -1,14 +1,15 @@
 """Sync state tracking for Taskwarrior-Reminders sync."""
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-import json
 
-from .config import CONFIG, load_json, save_json
+from .config import CONFIG, json_dumps, json_loads, write_atomic
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncMapping:
     """Tracks sync relationship between TW task and Reminder."""
     uuid: str                    # Taskwarrior UUID
@@ -17,23 +18,69 @@ class SyncMapping:
     reminder_modified: str       # ISO timestamp of last known Reminder modification
 
 
+def _content_key(state: dict) -> bytes:
+    """Serialize state without last_sync, to detect real changes."""
+    return json_dumps({k: v for k, v in state.items() if k != "last_sync"})
+
+
 class SyncState:
     """Manages sync state persistence."""
 
     def __init__(self, state_file: Optional[str] = None):
         self.state_file = Path(state_file or CONFIG["sync_state_file"])
         self._state = self._load()
+        self._dirty = False
+        self._batch_depth = 0
+        # Mapping objects by UUID, built once rather than on every lookup
+        self._mappings: dict[str, SyncMapping] = {
+            uuid: SyncMapping(**data)
+            for uuid, data in self._state["mappings"].items()
+        }
+        # Reverse index: reminder_id -> Taskwarrior UUID
+        self._by_reminder_id: dict[str, str] = {
+            m.reminder_id: uuid for uuid, m in self._mappings.items()
+        }
 
     def _load(self) -> dict:
         """Load state from file."""
-        data = load_json(self.state_file)
+        try:
+            raw = self.state_file.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        data = json_loads(raw) if raw else {}
         if "version" not in data:
             data = {"version": 1, "mappings": {}, "last_sync": None}
+        # Share one copy of the per-mapping field names across all entries
+        data["mappings"] = {
+            uuid: {sys.intern(k): v for k, v in mapping.items()}
+            for uuid, mapping in data["mappings"].items()
+        }
+        # What's on disk, so a save with no real changes can be skipped
+        self._saved_content = _content_key(data) if raw else None
         return data
 
     def _save(self) -> None:
-        """Save state to file."""
-        save_json(self.state_file, self._state)
+        """Save state to file, or defer until the outermost batch exits."""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        self._dirty = False
+        content = _content_key(self._state)
+        if content == self._saved_content:
+            return
+        write_atomic(self.state_file, json_dumps(self._state, indent=True))
+        self._saved_content = content
+
+    @contextmanager
+    def batch(self):
+        """Defer saves made inside the block to a single write at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save()
 
     @property
     def last_sync(self) -> Optional[datetime]:
@@ -42,39 +89,45 @@ class SyncState:
         return datetime.fromisoformat(ts) if ts else None
 
     def update_last_sync(self) -> None:
-        """Update last sync to now."""
+        """Update last sync to now.
+
+        Only written to disk along with other changes, so a sync that
+        changes no mappings leaves the state file untouched.
+        """
         self._state["last_sync"] = datetime.now().isoformat()
         self._save()
 
     def get_by_uuid(self, uuid: str) -> Optional[SyncMapping]:
         """Get mapping by Taskwarrior UUID."""
-        data = self._state["mappings"].get(uuid)
-        if data:
-            return SyncMapping(**data)
-        return None
+        return self._mappings.get(uuid)
 
     def get_by_reminder_id(self, reminder_id: str) -> Optional[SyncMapping]:
         """Get mapping by Reminder ID."""
-        for uuid, data in self._state["mappings"].items():
-            if data.get("reminder_id") == reminder_id:
-                return SyncMapping(**data)
-        return None
+        uuid = self._by_reminder_id.get(reminder_id)
+        return self.get_by_uuid(uuid) if uuid else None
 
     def set_mapping(self, mapping: SyncMapping) -> None:
         """Create or update a mapping."""
+        old = self._state["mappings"].get(mapping.uuid)
+        if old and old["reminder_id"] != mapping.reminder_id:
+            self._by_reminder_id.pop(old["reminder_id"], None)
         self._state["mappings"][mapping.uuid] = asdict(mapping)
+        self._mappings[mapping.uuid] = mapping
+        self._by_reminder_id[mapping.reminder_id] = mapping.uuid
         self._save()
 
     def remove_mapping(self, uuid: str) -> None:
         """Remove a mapping by UUID."""
         if uuid in self._state["mappings"]:
-            del self._state["mappings"][uuid]
+            data = self._state["mappings"].pop(uuid)
+            del self._mappings[uuid]
+            self._by_reminder_id.pop(data["reminder_id"], None)
             self._save()
 
     def all_mappings(self) -> list[SyncMapping]:
         """Get all mappings."""
-        return [SyncMapping(**data) for data in self._state["mappings"].values()]
+        return list(self._mappings.values())
 
     def known_reminder_ids(self) -> set[str]:
         """Get set of all known reminder IDs."""
-        return {m.reminder_id for m in self.all_mappings()}
+        return set(self._by_reminder_id)